@@ -5,42 +5,124 @@ Spotube: We sync Spotify to YouTube so you don't have to... awkwardly search you
 
 import json
 import os
+import queue
+import re
+import hashlib
 import html
+import shutil
 import subprocess
+import socket
+import tempfile
 import threading
 import time
-import io
 from itertools import cycle
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Dict, Optional
 import argparse
 import webbrowser
 from pathlib import Path
-import urllib.request
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk, messagebox, filedialog, scrolledtext
 from PIL import Image, ImageTk
 import requests
-from io import BytesIO
 
 import spotipy
-from spotipy.oauth2 import SpotifyOAuth
+from spotipy.oauth2 import SpotifyClientCredentials, SpotifyOAuth
+import httplib2
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+# orjson is optional; it just makes config parsing faster. Writing always
+# goes through the json module so config.json keeps the same layout either way
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
 # Global variables
 current_mpv_process = None
 DEFAULT_CONFIG_PATH = "config.json"
+VIDEO_CACHE_MAX_ITEMS = 50
+VIDEO_CACHE_TTL = 300  # seconds
+IMAGE_CACHE_DIR = Path.home() / ".cache" / "spotube" / "img"
+SEARCH_CACHE_PATH = Path.home() / ".cache" / "spotube" / "yt_search.json"
+SEARCH_CACHE_MAX_ITEMS = 256
+IMAGE_MEMORY_CACHE_SIZE = 32
+IMAGE_DISK_CACHE_MAX_FILES = 500
+PROGRESS_EXTRAPOLATION_POLLS = 2  # check intervals to extrapolate progress for before asking Spotify again
+SKIP_POLL_DELAY = 1  # seconds to give Spotify to switch tracks after a skip
+POLL_BUSY_RETRY_DELAY = 0.25  # seconds before retrying a check that found one still running
+UI_QUEUE_INTERVAL_MS = 50
+UI_QUEUE_MAX_ITEMS = 100
+YOUTUBE_HTTP_TIMEOUT = 10  # seconds; httplib2 would otherwise wait 60
+
+# Grid sticky values, built once instead of at every .grid() call
+NSEW = tk.N + tk.S + tk.E + tk.W
+NEW = tk.N + tk.E + tk.W
+EW = tk.E + tk.W
+
+# Settings that MPV only reads when it's launched
+_MPV_WINDOW_KEYS = ("mpv_fullscreen", "mpv_window_width", "mpv_window_height")
+
+# Characters stripped from video titles before they're used as the MPV window title
+_MPV_TITLE_TRANS = str.maketrans("", "", "\"'`$\\")
+
+# Shared HTTP session so image loads reuse pooled TLS connections
+_HTTP = requests.Session()
+
+
+def make_track_query(track_name: str, artist_name: str) -> str:
+    """Build the YouTube search query for a Spotify track."""
+    return f"{track_name} {artist_name} official music video"
+
+
+@lru_cache(maxsize=4)
+def _youtube_client(api_key: str):
+    """Return the shared YouTube API client for a key, building it once."""
+    return _build_youtube_client(api_key)
+
+
+def _build_youtube_client(api_key: str):
+    """Build a YouTube API client from the bundled discovery document."""
+    return build(
+        "youtube", "v3",
+        developerKey=api_key,
+        cache_discovery=False,
+        static_discovery=True,
+        http=httplib2.Http(timeout=YOUTUBE_HTTP_TIMEOUT),
+    )
+
+
+# googleapiclient's httplib2 transport isn't thread-safe and clients are shared
+_YOUTUBE_API_LOCK = threading.Lock()
+
 
 class ConfigManager:
     """Manages configuration loading, saving, and validation."""
     
+    # filename -> (mtime_ns, config) so repeat loads skip parsing
+    _cached: Dict[str, Any] = {}
+    
     @staticmethod
     def load_config(filename: str = DEFAULT_CONFIG_PATH) -> Dict[str, Any]:
         """Load configuration from a JSON file."""
         try:
-            with open(filename, "r") as f:
-                return json.load(f)
+            path = Path(filename)
+            mtime = path.stat().st_mtime_ns
+            cached = ConfigManager._cached.get(filename)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            
+            config = _json_loads(path.read_bytes())
+            ConfigManager._cached[filename] = (mtime, config)
+            return config
         except FileNotFoundError:
             default_config = {
                 "spotify": {
@@ -51,15 +133,14 @@ class ConfigManager:
                 },
                 "youtube": {"api_key": "YOUR_YOUTUBE_API_KEY"},
                 "app": {
-                    "check_interval": 5,
+                    "check_interval": 15,
                     "mute_spotify": True,
                     "mpv_fullscreen": False,
                     "mpv_window_width": 1280,
                     "mpv_window_height": 720,
                 },
             }
-            with open(filename, "w") as f:
-                json.dump(default_config, f, indent=4)
+            ConfigManager.save_config(default_config, filename)
             return default_config
         except json.JSONDecodeError:
             messagebox.showerror("Configuration Error", "Invalid JSON in config file.")
@@ -69,8 +150,9 @@ class ConfigManager:
     def save_config(config: Dict[str, Any], filename: str = DEFAULT_CONFIG_PATH) -> bool:
         """Save configuration to a JSON file."""
         try:
-            with open(filename, "w") as f:
-                json.dump(config, f, indent=4)
+            path = Path(filename)
+            path.write_text(json.dumps(config, indent=4))
+            ConfigManager._cached[filename] = (path.stat().st_mtime_ns, config)
             return True
         except Exception as e:
             messagebox.showerror("Configuration Error", f"Failed to save config: {e}")
@@ -98,6 +180,9 @@ class SpotifyManager:
         self.config = config
         self.client = None
         self.previous_volume = None
+        self.retry_after = None
+        self._backoff = 0
+        self._last_device_volume = None
     
     def get_client(self) -> Optional[spotipy.Spotify]:
         """Initialize and return a Spotify client."""
@@ -124,9 +209,14 @@ class SpotifyManager:
             return None
         
         try:
-            current_playback = sp.current_playback()
+            current_playback = sp.current_playback(additional_types="track")
+            self._backoff = 0
             if current_playback is None or not current_playback.get("is_playing", False):
                 return None
+            
+            # Remember the volume so muting doesn't need another round trip
+            device = current_playback.get("device") or {}
+            self._last_device_volume = device.get("volume_percent")
 
             # Make sure we have a valid item
             if "item" not in current_playback or current_playback["item"] is None:
@@ -147,17 +237,57 @@ class SpotifyManager:
                 "artist_name": artist_name,
                 "album_name": album_name,
                 "album_art_url": album_art_url,
-                "track_query": f"{track_name} {artist_name} official music video",
                 "progress_ms": progress_ms,
                 "duration_ms": duration_ms,
             }
         except spotipy.exceptions.SpotifyException as e:
             print(f"Spotify API error: {e}")
+            self._back_off(e)
             return None
         except Exception as e:
             print(f"Failed to get current track: {e}")
             return None
     
+    def _back_off(self, error: spotipy.exceptions.SpotifyException) -> None:
+        """Record how long to wait before polling Spotify again."""
+        interval = self.config["app"]["check_interval"]
+        self._backoff = min(self._backoff * 2 or interval, 300)
+        retry_after = None
+        if error.http_status == 429 and error.headers:
+            retry_after = error.headers.get("Retry-After")
+        try:
+            self.retry_after = float(retry_after) if retry_after else self._backoff
+        except ValueError:
+            self.retry_after = self._backoff
+    
+    def get_next_track(self) -> Optional[Dict[str, Any]]:
+        """Fetch the next track in the Spotify queue."""
+        sp = self.get_client()
+        if not sp:
+            return None
+        
+        try:
+            queue = sp.queue()
+            upcoming = queue.get("queue") if queue else None
+            if not upcoming:
+                return None
+            
+            track = upcoming[0]
+            # Podcast episodes have no artists to search with
+            if not track or not track.get("artists"):
+                return None
+            
+            return {
+                "track_id": track["id"],
+                "track_query": make_track_query(track["name"], track["artists"][0]["name"]),
+            }
+        except spotipy.exceptions.SpotifyException as e:
+            print(f"Failed to get the Spotify queue: {e}")
+            return None
+        except Exception as e:
+            print(f"Failed to get next track: {e}")
+            return None
+    
     def set_volume(self, volume: int) -> bool:
         """Set the Spotify playback volume."""
         sp = self.get_client()
@@ -167,9 +297,9 @@ class SpotifyManager:
         try:
             # Store the previous volume if we're muting
             if volume <= 5 and self.previous_volume is None:
-                current = sp.current_playback()
-                if current and "device" in current:
-                    self.previous_volume = current["device"].get("volume_percent", 100)
+                self.previous_volume = (
+                    self._last_device_volume if self._last_device_volume is not None else 100
+                )
             
             sp.volume(volume)
             return True
@@ -218,43 +348,112 @@ class YouTubeManager:
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
+        self._yt = None
+        
+        # Normalized query -> video_info, least recently used first
+        self._search_cache = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+        self.load_search_cache()
+    
+    def get_client(self):
+        """Build the YouTube API client once and reuse it."""
+        if self._yt is None:
+            self._yt = _youtube_client(self.config["youtube"]["api_key"])
+        return self._yt
     
-    def search_video(self, query: str) -> Optional[Dict[str, str]]:
-        """Search for a YouTube video using the YouTube Data API."""
+    def load_search_cache(self, path: Path = SEARCH_CACHE_PATH) -> None:
+        """Load search results saved by a previous session."""
         try:
-            youtube = build(
-                "youtube", "v3", developerKey=self.config["youtube"]["api_key"]
-            )
-            request = youtube.search().list(
-                part="snippet", q=query, type="video", maxResults=1
-            )
-            response = request.execute()
-            if "items" not in response or len(response["items"]) == 0:
-                return None
-
-            video_id = response["items"][0]["id"]["videoId"]
-            video_title = response["items"][0]["snippet"]["title"]
-            thumbnail_url = response["items"][0]["snippet"]["thumbnails"]["high"]["url"]
-            
-            # Decode HTML entities in the video title
-            decoded_title = html.unescape(video_title)
-            
-            return {
-                "url": f"https://www.youtube.com/watch?v={video_id}",
-                "title": decoded_title,  # Use the decoded title here
-                "id": video_id,
-                "thumbnail_url": thumbnail_url
-            }
-        except Exception as e:
-            print(f"Error searching for video: {e}")
-            return None
+            entries = json.loads(path.read_text())
+            # Expect a list of [query, video_info] pairs; skip anything else
+            loaded = [
+                (query, video_info)
+                for query, video_info in entries[-SEARCH_CACHE_MAX_ITEMS:]
+                if isinstance(query, str) and isinstance(video_info, dict)
+            ]
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            print(f"Failed to load YouTube search cache: {e}")
+            return
+        
+        with self._search_cache_lock:
+            self._search_cache.update(loaded)
+    
+    def save_search_cache(self, path: Path = SEARCH_CACHE_PATH) -> None:
+        """Persist cached search results for the next session."""
+        with self._search_cache_lock:
+            entries = list(self._search_cache.items())
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(entries))
+        except OSError as e:
+            print(f"Failed to save YouTube search cache: {e}")
+    
+    def search_video(self, query: str, raise_errors: bool = False) -> Optional[Dict[str, str]]:
+        """Search for a YouTube video, reusing earlier results for the same query.
+        
+        Returns None when nothing was found. Errors also return None unless
+        raise_errors is set, so callers can tell the two apart when they need to.
+        """
+        query_norm = " ".join(query.lower().split())
+        with self._search_cache_lock:
+            video_info = self._search_cache.get(query_norm)
+            if video_info is not None:
+                self._search_cache.move_to_end(query_norm)
+                return video_info
+        
+        try:
+            video_info = self._search_uncached(query)
         except HttpError as e:
             print(f"YouTube API error: {e}")
+            if raise_errors:
+                raise
             return None
         except Exception as e:
             print(f"Failed to search YouTube: {e}")
+            if raise_errors:
+                raise
+            return None
+        
+        # Failed searches aren't cached so they get retried next time
+        if video_info is not None:
+            with self._search_cache_lock:
+                self._search_cache[query_norm] = video_info
+                while len(self._search_cache) > SEARCH_CACHE_MAX_ITEMS:
+                    self._search_cache.popitem(last=False)
+        return video_info
+    
+    def _search_uncached(self, query: str) -> Optional[Dict[str, str]]:
+        """Search for a YouTube video using the YouTube Data API.
+        
+        Returns None if there were no results; API and network errors are raised.
+        """
+        youtube = self.get_client()
+        request = youtube.search().list(
+            part="snippet", q=query, type="video", maxResults=1,
+            # Only return the fields we actually use
+            fields="items(id/videoId,snippet(title,thumbnails/high/url))",
+        )
+        with _YOUTUBE_API_LOCK:
+            response = request.execute()
+        if "items" not in response or len(response["items"]) == 0:
             return None
 
+        video_id = response["items"][0]["id"]["videoId"]
+        video_title = response["items"][0]["snippet"]["title"]
+        thumbnail_url = response["items"][0]["snippet"]["thumbnails"]["high"]["url"]
+        
+        # Decode HTML entities in the video title
+        decoded_title = html.unescape(video_title)
+        
+        return {
+            "url": f"https://www.youtube.com/watch?v={video_id}",
+            "title": decoded_title,  # Use the decoded title here
+            "id": video_id,
+            "thumbnail_url": thumbnail_url
+        }
+
 
 class MPVManager:
     """Manages MPV player interactions."""
@@ -262,6 +461,7 @@ class MPVManager:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.current_process = None
+        self._ipc = None
     
     def check_installation(self) -> bool:
         """Check if MPV is installed and accessible."""
@@ -280,16 +480,20 @@ class MPVManager:
     def play_video(self, video_info: Dict[str, str], start_time_ms: int) -> bool:
         """Play a video using MPV."""
         try:
-            # Kill any existing MPV instances
-            self.kill_processes()
-
             # Convert start time to seconds
             start_time_seconds = max(0, start_time_ms / 1000)  # Ensure non-negative
 
             # Create a window title with the video info - sanitize it
-            safe_title = video_info["title"].replace('"', "").replace("'", "")
+            safe_title = video_info["title"].translate(_MPV_TITLE_TRANS)
             window_title = f"Spotube: {safe_title}"
 
+            # Reuse the running MPV window if there is one
+            if self._load_in_running_player(video_info["url"], start_time_seconds, window_title):
+                return True
+
+            # Otherwise kill any leftover MPV instance and start a fresh one
+            self.kill_processes()
+
             # MPV options from config
             mpv_fullscreen = self.config["app"].get("mpv_fullscreen", False)
             mpv_window_width = self.config["app"].get("mpv_window_width", 1280)
@@ -301,6 +505,8 @@ class MPVManager:
                 video_info["url"],
                 f"--start={start_time_seconds}",
                 "--force-window=yes",
+                "--idle=yes",
+                f"--input-ipc-server={self._get_ipc_path()}",
                 f"--title={window_title}",
                 "--no-terminal",
             ]
@@ -312,11 +518,11 @@ class MPVManager:
                     [f"--geometry={mpv_window_width}x{mpv_window_height}"]
                 )
 
+            # MPV now outlives individual tracks, so don't leave unread pipes behind
             self.current_process = subprocess.Popen(
                 mpv_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
 
             return True
@@ -327,13 +533,75 @@ class MPVManager:
             print(f"Failed to play video: {e}")
             return False
     
-    def kill_processes(self) -> None:
-        """Kill all running MPV processes."""
+    def _get_ipc_path(self) -> str:
+        """Return the path of the IPC socket (or named pipe on Windows) for MPV."""
+        if self._ipc is None:
+            if os.name == "nt":
+                self._ipc = rf"\\.\pipe\spotube-mpv-{os.getpid()}"
+            else:
+                self._ipc = os.path.join(tempfile.mkdtemp(prefix="spotube-"), "mpv.sock")
+        return self._ipc
+    
+    def _send_commands(self, commands) -> None:
+        """Send a batch of JSON IPC commands to the running MPV instance."""
+        payload = b"".join(
+            json.dumps({"command": command}).encode() + b"\n" for command in commands
+        )
+        if os.name == "nt":
+            with open(self._ipc, "r+b", buffering=0) as pipe:
+                pipe.write(payload)
+        else:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(1)
+                sock.connect(self._ipc)
+                sock.sendall(payload)
+    
+    def _load_in_running_player(self, url: str, start_time_seconds: float, window_title: str) -> bool:
+        """Load a video into the already running MPV window over IPC."""
+        if self.current_process is None or self.current_process.poll() is not None:
+            return False
+        
         try:
-            if self.current_process:
+            self._send_commands([
+                ["set_property", "start", str(start_time_seconds)],
+                ["set_property", "title", window_title],
+                ["loadfile", url, "replace"],
+            ])
+            return True
+        except OSError as e:
+            print(f"MPV IPC failed, restarting player: {e}")
+            return False
+    
+    def kill_processes(self) -> None:
+        """Stop the MPV process we started, if any."""
+        if self.current_process:
+            try:
                 self.current_process.terminate()
+                try:
+                    self.current_process.wait(timeout=0.3)
+                except subprocess.TimeoutExpired:
+                    self.current_process.kill()
+                    self.current_process.wait(timeout=0.5)
+            except Exception as e:
+                print(f"Failed to stop MPV: {e}")
+            finally:
                 self.current_process = None
-                
+        
+        self._remove_ipc_path()
+    
+    def _remove_ipc_path(self) -> None:
+        """Delete the temporary directory holding the IPC socket, if we made one."""
+        if self._ipc is None:
+            return
+        # Named pipes on Windows go away with the process
+        if os.name != "nt":
+            shutil.rmtree(os.path.dirname(self._ipc), ignore_errors=True)
+        self._ipc = None
+    
+    def kill_all(self) -> None:
+        """Kill every running MPV process, including ones we lost track of."""
+        self.kill_processes()
+        try:
             if os.name == "nt":  # Windows
                 subprocess.run(
                     ["taskkill", "/F", "/IM", "mpv.exe"],
@@ -348,7 +616,6 @@ class MPVManager:
                     stderr=subprocess.DEVNULL,
                     check=False,
                 )
-            time.sleep(0.5)  # Give it time to close
         except Exception as e:
             print(f"Failed to kill MPV processes: {e}")
 
@@ -365,6 +632,10 @@ class SpotubeGUI:
         self.style = ttk.Style()
         self.style.theme_use('clam')
         
+        # Shared dark styles for dialogs; the main window's own settings below
+        # take precedence for the widget classes they both touch
+        _init_styles(self.root)
+        
         # Configure colors
         self.bg_color = "#121212"
         self.text_color = "#FFFFFF"
@@ -383,6 +654,7 @@ class SpotubeGUI:
         if not self.config:
             self.root.destroy()
             return
+        self._cache_app_settings()
         
         # Initialize managers
         self.spotify = SpotifyManager(self.config)
@@ -391,24 +663,60 @@ class SpotubeGUI:
         
         # State variables
         self.running = False
-        self.monitor_thread = None
+        self._poll_after_id = None
+        self._poll_due = 0.0
+        self._poll_future = None
+        self._last_track_id = None
+        self._displayed_track_id = None
         self.current_track = None
         self.current_video = None
+        self._last_displayed_sec = None
+        self._config_dialog = None
+        self._last_status = None
+        
+        # Worker pool for Spotify polls and the network/process calls they trigger
+        self._pool = ThreadPoolExecutor(max_workers=4)
+        
+        # Decoded images: (url, width, height) -> PhotoImage. Tk thread only.
+        self._img_mem = OrderedDict()
+        
+        # Prefetched videos: track_id -> (fetched_at, video_info)
+        self._video_cache = OrderedDict()
+        self._video_cache_lock = threading.Lock()
+        
+        # Updates posted by worker threads: (key, callback, args)
+        self._ui_queue = queue.Queue()
+        
+        # Last real Spotify poll: (monotonic time, track_info)
+        self._last_poll = None
+        self._force_poll = False
         
         # Create UI
         self.create_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.after(UI_QUEUE_INTERVAL_MS, self._drain_ui_queue)
         
-        # Check MPV installation
-        if not self.mpv.check_installation():
-            messagebox.showwarning(
-                "MPV Not Found", 
-                "MPV player is not installed or not in your PATH. "
-                "Please install MPV to play videos."
-            )
+        # Run startup checks once the window has painted
+        self.root.after(100, self._post_init_checks)
+        
+    def _post_init_checks(self):
+        """Check the MPV installation and configuration after the UI is shown."""
+        # Spawning mpv --version can be slow, so do it on the worker pool
+        self._pool.submit(self._check_mpv_installation)
         
         # Check configuration
         if not ConfigManager.validate_config(self.config):
             self.show_config_dialog()
+    
+    def _check_mpv_installation(self):
+        """Warn the user (via the UI queue) if MPV can't be found."""
+        if not self.mpv.check_installation():
+            self._post_ui(
+                "mpv_check", messagebox.showwarning,
+                "MPV Not Found",
+                "MPV player is not installed or not in your PATH. "
+                "Please install MPV to play videos."
+            )
         
     def create_ui(self):
         """Create the user interface."""
@@ -648,6 +956,7 @@ class SpotubeGUI:
             variable=self.mute_spotify_var
         )
         self.mute_spotify_check.pack(side=tk.LEFT, padx=10)
+        self.mute_spotify_var.trace_add("write", self._on_mute_spotify_changed)
         
         # Status bar
         status_bar = ttk.Frame(self.root, relief=tk.SUNKEN)
@@ -664,6 +973,15 @@ class SpotubeGUI:
         # Update UI state
         self.update_ui_state()
     
+    def _cache_app_settings(self):
+        """Copy settings read on every poll into plain attributes."""
+        self._check_interval_s = self.config["app"]["check_interval"]
+        self._mute_spotify = self.config["app"]["mute_spotify"]
+    
+    def _on_mute_spotify_changed(self, *args):
+        """Keep the cached mute setting in sync with the checkbox."""
+        self._mute_spotify = self.mute_spotify_var.get()
+    
     def update_ui_state(self):
         """Update UI elements based on current state."""
         if self.running:
@@ -673,16 +991,60 @@ class SpotubeGUI:
             self.status_var.set("Not Running")
             self.status_indicator.configure(foreground=self.secondary_color)
     
-    def load_image_from_url(self, url, width, height):
+    def load_image_from_url(self, url, width, height, resample=Image.LANCZOS):
         """Load an image from a URL and resize it."""
-        try:
-            response = requests.get(url)
-            img = Image.open(BytesIO(response.content))
-            img = img.resize((width, height), Image.LANCZOS)
-            return ImageTk.PhotoImage(img)
-        except Exception as e:
-            print(f"Failed to load image: {e}")
-            return None
+        key = (url, width, height)
+        photo = self._get_cached_photo(key)
+        if photo is None:
+            img = self._fetch_image(url, width, height, resample)
+            if img is None:
+                return None
+            photo = self._cache_photo(key, img)
+        return photo
+    
+    def _get_cached_photo(self, key):
+        """Return a previously decoded image, marking it as recently used."""
+        photo = self._img_mem.get(key)
+        if photo is not None:
+            self._img_mem.move_to_end(key)
+        return photo
+    
+    def _cache_photo(self, key, img):
+        """Convert a PIL image to a PhotoImage and keep it in the memory cache."""
+        photo = ImageTk.PhotoImage(img)
+        self._img_mem[key] = photo
+        while len(self._img_mem) > IMAGE_MEMORY_CACHE_SIZE:
+            self._img_mem.popitem(last=False)
+        return photo
+    
+    def _fetch_image(self, url, width, height, resample=Image.LANCZOS):
+        """Download and resize an image. Safe to call off the Tk thread."""
+        return load_image_from_url(url, (width, height), resample)
+    
+    def _show_image_async(self, url, width, height, label, resample=Image.LANCZOS):
+        """Load an image in the background and show it on the label once it arrives."""
+        key = (url, width, height)
+        label.pending_url = url
+        photo = self._get_cached_photo(key)
+        if photo is not None:
+            label.configure(image=photo)
+            label.image = photo  # Keep a reference
+            return
+        self._pool.submit(self._fetch_and_post_image, key, label, resample)
+    
+    def _fetch_and_post_image(self, key, label, resample):
+        """Worker side of _show_image_async: fetch, then hand off to the Tk thread."""
+        img = self._fetch_image(*key, resample)
+        if img is not None:
+            self._post_ui(("image", label), self._apply_image, label, key, img)
+    
+    def _apply_image(self, label, key, img):
+        """Display a fetched image unless the label has moved on to another URL."""
+        photo = self._cache_photo(key, img)
+        if getattr(label, "pending_url", None) != key[0]:
+            return
+        label.configure(image=photo)
+        label.image = photo  # Keep a reference
         
     def update_track_display(self, track_info):
         """Update the track display with new track information."""
@@ -692,6 +1054,8 @@ class SpotubeGUI:
             self.album_name_var.set("")
             self.progress_var.set(0)
             self.time_var.set("0:00 / 0:00")
+            self._last_displayed_sec = None
+            self.album_art_label.pending_url = None
             self.album_art_label.configure(image="")
             return
         
@@ -700,28 +1064,36 @@ class SpotubeGUI:
         self.album_name_var.set(track_info["album_name"])
         
         # Update progress
-        progress_sec = track_info["progress_ms"] / 1000
-        duration_sec = track_info["duration_ms"] / 1000
+        self._update_progress_only(track_info["progress_ms"], track_info["duration_ms"])
+        
+        # Load album art
+        if track_info.get("album_art_url"):
+            self._show_image_async(track_info["album_art_url"], 250, 250, self.album_art_label)
+    
+    def _update_progress_only(self, progress_ms, duration_ms):
+        """Update the progress bar and time label without touching track details."""
+        progress_sec = progress_ms / 1000
+        duration_sec = duration_ms / 1000
         progress_pct = (progress_sec / duration_sec) * 100 if duration_sec > 0 else 0
         self.progress_var.set(progress_pct)
         
+        # Skip reformatting the label if the displayed time hasn't changed
+        displayed_sec = (int(progress_sec), int(duration_sec))
+        if displayed_sec == self._last_displayed_sec:
+            return
+        self._last_displayed_sec = displayed_sec
+        
         # Format time as MM:SS
         progress_str = f"{int(progress_sec // 60)}:{int(progress_sec % 60):02d}"
         duration_str = f"{int(duration_sec // 60)}:{int(duration_sec % 60):02d}"
         self.time_var.set(f"{progress_str} / {duration_str}")
-        
-        # Load album art
-        if track_info.get("album_art_url"):
-            img = self.load_image_from_url(track_info["album_art_url"], 250, 250)
-            if img:
-                self.album_art_label.configure(image=img)
-                self.album_art_label.image = img  # Keep a reference
     
     def update_video_display(self, video_info):
         """Update the video display with new video information."""
         if not video_info:
             self.decoded_title_var.set("No video playing")
             self.video_url_var.set("")
+            self.video_thumb_label.pending_url = None
             self.video_thumb_label.configure(image="")
             self.video_url_link.pack_forget()
             return
@@ -732,10 +1104,10 @@ class SpotubeGUI:
         
         # Load thumbnail
         if video_info.get("thumbnail_url"):
-            img = self.load_image_from_url(video_info["thumbnail_url"], 250, 140)
-            if img:
-                self.video_thumb_label.configure(image=img)
-                self.video_thumb_label.image = img  # Keep a reference
+            # The thumbnail is small and transient, so a cheaper filter is fine
+            self._show_image_async(
+                video_info["thumbnail_url"], 250, 140, self.video_thumb_label, Image.BICUBIC
+            )
     
     def open_video_in_browser(self, event=None):
         """Open the current video URL in a web browser."""
@@ -750,11 +1122,13 @@ class SpotubeGUI:
         
         self.running = True
         self.update_ui_state()
-        self.status_message.set("Starting monitoring...")
+        self._set_status("Starting monitoring...")
         
-        # Start monitoring in a separate thread
-        self.monitor_thread = threading.Thread(target=self.monitor_spotify, daemon=True)
-        self.monitor_thread.start()
+        # Start polling from the Tk event loop
+        self._last_poll = None
+        self._last_track_id = None
+        self._displayed_track_id = None
+        self._schedule_poll(0)
     
     def stop_monitoring(self):
         """Stop monitoring and clean up."""
@@ -762,8 +1136,11 @@ class SpotubeGUI:
             return
         
         self.running = False
+        if self._poll_after_id is not None:
+            self.root.after_cancel(self._poll_after_id)
+            self._poll_after_id = None
         self.update_ui_state()
-        self.status_message.set("Stopping monitoring...")
+        self._set_status("Stopping monitoring...")
         
         # Kill any playing videos
         self.mpv.kill_processes()
@@ -772,102 +1149,376 @@ class SpotubeGUI:
         if self.mute_spotify_var.get():
             self.spotify.restore_volume()
         
-        self.status_message.set("Monitoring stopped")
+        self._set_status("Monitoring stopped")
     
-    def monitor_spotify(self):
-        """Monitor Spotify for track changes and play corresponding YouTube videos."""
-        last_track_id = None
-        
-        while self.running:
+    def _set_status(self, message):
+        """Set the status bar text, skipping the Tcl call if it's unchanged."""
+        if message == self._last_status:
+            return
+        self._last_status = message
+        self.status_message.set(message)
+    
+    def _post_ui(self, key, callback, *args):
+        """Queue a UI update from a worker thread; only the latest per key is applied."""
+        self._ui_queue.put((key, callback, args))
+    
+    def _post_status(self, message):
+        """Queue a status bar message from a worker thread."""
+        self._post_ui("status", self._set_status, message)
+    
+    def _drain_ui_queue(self):
+        """Apply queued UI updates on the Tk thread, then re-arm."""
+        pending = {}
+        for _ in range(UI_QUEUE_MAX_ITEMS):
+            try:
+                key, callback, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            # Re-insert so updates are applied in the order their latest version arrived
+            pending.pop(key, None)
+            pending[key] = (callback, args)
+        
+        for callback, args in pending.values():
             try:
-                # Get current track
-                track_info = self.spotify.get_currently_playing()
+                callback(*args)
+            except Exception as e:
+                print(f"Failed to update UI: {e}")
+        
+        self.root.after(UI_QUEUE_INTERVAL_MS, self._drain_ui_queue)
+    
+    def on_close(self):
+        """Stop monitoring, clean up any MPV windows and exit."""
+        self.stop_monitoring()
+        # Don't let queued searches or prefetches keep the process alive after the window is gone
+        try:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        except TypeError:  # cancel_futures needs Python 3.9+
+            self._pool.shutdown(wait=False)
+        self.mpv.kill_all()
+        self.youtube.save_search_cache()
+        self.root.destroy()
+    
+    def _schedule_poll(self, delay):
+        """Schedule the next Spotify check in `delay` seconds, unless one is already due sooner. Tk thread only."""
+        if not self.running:
+            return
+        due = time.monotonic() + delay
+        if self._poll_after_id is not None:
+            if self._poll_due <= due:
+                return
+            self.root.after_cancel(self._poll_after_id)
+        self._poll_due = due
+        self._poll_after_id = self.root.after(int(delay * 1000), self._poll)
+    
+    def _poll(self):
+        """Hand one Spotify check off to the worker pool."""
+        self._poll_after_id = None
+        if not self.running:
+            return
+        # A check is still in flight (e.g. after a skip); try again shortly so this
+        # earlier check isn't replaced by the one the running check schedules
+        if self._poll_future is not None and not self._poll_future.done():
+            self._schedule_poll(POLL_BUSY_RETRY_DELAY)
+            return
+        self._poll_future = self._pool.submit(self.monitor_spotify)
+    
+    def monitor_spotify(self):
+        """Check Spotify once for track changes and play the corresponding YouTube video."""
+        delay = self._check_interval_s
+        try:
+            # Get current track
+            track_info = self._get_track_info()
+            delay = self._next_poll_delay(track_info)
+            
+            # Update UI with track info, redrawing details only when the track changes
+            if not track_info:
+                if self._displayed_track_id is not None:
+                    self._post_ui("track", self.update_track_display, None)
+                self._displayed_track_id = None
+                return
+            
+            if track_info["track_id"] != self._displayed_track_id:
+                self._post_ui("track", self.update_track_display, track_info)
+                self._displayed_track_id = track_info["track_id"]
+            else:
+                self._post_ui(
+                    "progress", self._update_progress_only,
+                    track_info["progress_ms"], track_info["duration_ms"]
+                )
+            
+            # Everything below (search, MPV, mute) only runs once per track,
+            # even if no video is found for it. Search or playback errors leave
+            # the track unhandled so the next poll tries again
+            if track_info["track_id"] != self._last_track_id:
+                self._post_status(f"New track detected: {track_info['track_name']}")
                 
-                # Update UI with track info
-                self.root.after(0, lambda t=track_info: self.update_track_display(t))
+                # Use the prefetched video if we have one, otherwise search
+                video_info = self._get_cached_video(track_info["track_id"])
+                if video_info is None:
+                    self._post_status("Searching for video...")
+                    track_query = make_track_query(track_info["track_name"], track_info["artist_name"])
+                    video_info = self.youtube.search_video(track_query, raise_errors=True)
                 
-                if not track_info:
-                    time.sleep(self.config["app"]["check_interval"])
-                    continue
+                # Monitoring may have been stopped while we were searching
+                if not self.running:
+                    return
                 
-                # Check if track has changed
-                if track_info["track_id"] != last_track_id:
-                    self.status_message.set(f"New track detected: {track_info['track_name']}")
-                    
-                    # Search for video
-                    self.root.after(0, lambda: self.status_message.set("Searching for video..."))
-                    video_info = self.youtube.search_video(track_info["track_query"])
+                self._last_track_id = track_info["track_id"]
+                
+                # Update UI with video info
+                self._post_ui("video", self.update_video_display, video_info)
+                
+                if video_info:
+                    # Mute Spotify (if configured) while MPV starts up
+                    mute_future = None
+                    if self._mute_spotify:
+                        mute_future = self._pool.submit(self.spotify.set_volume, 0)
                     
-                    # Update UI with video info
-                    self.root.after(0, lambda v=video_info: self.update_video_display(v))
+                    # Play video
+                    self._post_status("Playing video...")
+                    play_future = self._pool.submit(
+                        self.mpv.play_video, video_info, track_info["progress_ms"]
+                    )
+                    played = play_future.result()
+                    if mute_future is not None:
+                        mute_future.result()
                     
-                    if video_info:
-                        # Mute Spotify if configured
-                        if self.mute_spotify_var.get():
-                            self.spotify.set_volume(0)
-                        
-                        # Play video
-                        self.root.after(0, lambda: self.status_message.set("Playing video..."))
-                        self.mpv.play_video(video_info, track_info["progress_ms"])
+                    if played:
+                        self._pool.submit(self._prefetch_next)
                         self.current_video = video_info
-                        
-                        self.root.after(0, lambda: self.status_message.set(f"Now playing: {video_info['title']}"))
-                        last_track_id = track_info["track_id"]
+                        self._post_status(f"Now playing: {video_info['title']}")
                     else:
-                        self.root.after(0, lambda: self.status_message.set("No video found for this track"))
-                
-                # Sleep for the configured interval
-                time.sleep(self.config["app"]["check_interval"])
-                
-            except Exception as e:
-                self.root.after(0, lambda e=e: self.status_message.set(f"Error: {e}"))
-                time.sleep(self.config["app"]["check_interval"])
-                
+                        self._last_track_id = None
+                        self._post_status("Failed to play video")
+                else:
+                    self._post_status("No video found for this track")
+            
+        except Exception as e:
+            self._post_status(f"Error: {e}")
+        finally:
+            self._post_ui("poll", self._schedule_poll, delay)
+    
+    def _get_track_info(self):
+        """Get the current track, extrapolating progress locally when it's safe to."""
+        if self._last_poll is not None and not self._force_poll:
+            polled_at, last_info = self._last_poll
+            elapsed_ms = (time.monotonic() - polled_at) * 1000
+            progress_ms = last_info["progress_ms"] + elapsed_ms
+            
+            # Only trust the local clock mid-track and for a limited time
+            limit_ms = self._check_interval_s * PROGRESS_EXTRAPOLATION_POLLS * 1000
+            if (elapsed_ms < limit_ms and
+                    progress_ms < last_info["duration_ms"] - 2000):
+                return dict(last_info, progress_ms=int(progress_ms))
+        
+        self._force_poll = False
+        track_info = self.spotify.get_currently_playing()
+        self._last_poll = (time.monotonic(), track_info) if track_info else None
+        return track_info
+    
+    def _next_poll_delay(self, track_info):
+        """Work out how long to wait before polling Spotify again."""
+        interval = self._check_interval_s
+        
+        # Honor Spotify's rate limiting / error backoff first
+        retry_after, self.spotify.retry_after = self.spotify.retry_after, None
+        if retry_after:
+            return max(interval, retry_after)
+        
+        if not track_info:
+            return interval
+        
+        # Poll just before the current track ends so the next video starts promptly
+        remaining = (track_info["duration_ms"] - track_info["progress_ms"]) / 1000 - 2
+        return max(1, min(interval, remaining))
+    
+    def _get_cached_video(self, track_id):
+        """Pop a prefetched video for the track if it hasn't expired."""
+        with self._video_cache_lock:
+            entry = self._video_cache.pop(track_id, None)
+        if entry is None:
+            return None
+        fetched_at, video_info = entry
+        if time.monotonic() - fetched_at > VIDEO_CACHE_TTL:
+            return None
+        return video_info
+    
+    def _prefetch_next(self):
+        """Search YouTube for the next queued track ahead of time."""
+        next_track = self.spotify.get_next_track()
+        if not next_track:
+            return
+        
+        with self._video_cache_lock:
+            if next_track["track_id"] in self._video_cache:
+                return
+        
+        video_info = self.youtube.search_video(next_track["track_query"])
+        if not video_info:
+            return
+        
+        with self._video_cache_lock:
+            self._video_cache[next_track["track_id"]] = (time.monotonic(), video_info)
+            while len(self._video_cache) > VIDEO_CACHE_MAX_ITEMS:
+                self._video_cache.popitem(last=False)
+    
     def next_track(self):
         """Skip to the next track."""
         if self.spotify.skip_to_next_track():
-            self.status_message.set("Skipped to next track")
+            self._force_poll = True
+            self._schedule_poll(SKIP_POLL_DELAY)
+            self._set_status("Skipped to next track")
         else:
-            self.status_message.set("Failed to skip to next track")
+            self._set_status("Failed to skip to next track")
     
     def previous_track(self):
         """Skip to the previous track."""
         if self.spotify.skip_to_previous_track():
-            self.status_message.set("Skipped to previous track")
+            self._force_poll = True
+            self._schedule_poll(SKIP_POLL_DELAY)
+            self._set_status("Skipped to previous track")
         else:
-            self.status_message.set("Failed to skip to previous track")
+            self._set_status("Failed to skip to previous track")
     
     def show_config_dialog(self):
         """Show the configuration dialog."""
-        config_dialog = ConfigDialog(self.root, self.config)
-        if config_dialog.result:
-            self.config = config_dialog.result
+        # Build the dialog once and keep it around hidden between uses
+        if self._config_dialog is None:
+            self._config_dialog = ConfigDialog(self.root, self.config, withdraw=True)
+        else:
+            self._config_dialog.reload(self.config)
+        
+        old_config = self.config
+        result = self._config_dialog.show()
+        # Saving without changing anything shouldn't rewrite the file or reset the clients
+        if result and result != self.config:
+            self.config = result
             ConfigManager.save_config(self.config)
+            self._cache_app_settings()
+            
+            # Only rebuild the managers whose settings changed; the rest just
+            # pick up the new config
+            if old_config["spotify"] != self.config["spotify"]:
+                self.spotify = SpotifyManager(self.config)
+            else:
+                self.spotify.config = self.config
+            
+            if old_config["youtube"] != self.config["youtube"]:
+                self.youtube.save_search_cache()
+                self.youtube = YouTubeManager(self.config)
+            else:
+                self.youtube.config = self.config
+            
+            self.mpv.config = self.config
             
-            # Reinitialize managers with new config
-            self.spotify = SpotifyManager(self.config)
-            self.youtube = YouTubeManager(self.config)
-            self.mpv = MPVManager(self.config)
+            # The MPV window is reused between tracks and only reads its window
+            # options at launch, so restart it to apply changed ones
+            if any(old_config["app"].get(key) != self.config["app"].get(key) for key in _MPV_WINDOW_KEYS):
+                self.mpv.kill_processes()
+                self._last_track_id = None
+            
+            # Apply a shorter check interval right away rather than after the next poll
+            if self._poll_after_id is not None:
+                self._schedule_poll(self._check_interval_s)
             
             # Update UI
             self.mute_spotify_var.set(self.config["app"]["mute_spotify"])
-            self.status_message.set("Configuration updated")
+            self._set_status("Configuration updated")
+
+
+_SPOTIFY_HELP_TEXT = (
+    "To connect Spotube with your Spotify account:\n\n"
+    "1. Go to https://developer.spotify.com/dashboard/ and log in\n"
+    "2. Click 'Create App' button\n"
+    "3. Fill in the following details:\n"
+    "   • App name: Spotube (or any name you prefer)\n"
+    "   • App description: Personal YouTube music video player\n"
+    "   • Website: You can leave this blank\n"
+    "   • Redirect URI: http://localhost:8080\n"
+    "4. Check the Developer Terms of Service and click 'Create'\n"
+    "5. On your app's dashboard, you'll see your Client ID\n"
+    "6. Click 'Show Client Secret' to reveal your Client Secret\n"
+    "7. Copy both values to the fields above\n\n"
+    "Important: Keep your Client Secret private. Never share it publicly.\n\n"
+    "When you first run Spotube, a browser window will open asking you to\n"
+    "authorize the app to access your Spotify account. This is normal and\n"
+    "required for Spotube to see what you're currently playing."
+)
+
+_YT_HELP_TEXT = (
+    "To get a YouTube Data API key:\n\n"
+    "1. Go to https://console.cloud.google.com/\n"
+    "2. Sign in with your Google account\n"
+    "3. Create a new project (click on project dropdown at top → New Project)\n"
+    "4. Once in your project, go to 'APIs & Services' → 'Library'\n"
+    "5. Search for 'YouTube Data API v3' and select it\n"
+    "6. Click 'Enable' to activate the API for your project\n"
+    "7. Go to 'APIs & Services' → 'Credentials'\n"
+    "8. Click 'Create Credentials' → 'API key'\n"
+    "9. Copy your new API key and paste it in the field above\n\n"
+    "Note: The free tier allows 10,000 queries per day, which is plenty for personal use."
+)
+
+_ABOUT_TEXT = (
+    "Spotube plays YouTube music videos that match your currently playing Spotify tracks.\n\n"
+    "Requirements:\n"
+    "• MPV Player (https://mpv.io/)\n"
+    "• Spotify Premium account\n"
+    "• YouTube Data API key\n\n"
+    "Version: 1.0.0"
+)
+
+_REDIRECT_URI_RE = re.compile(r"^https?://[^\s/:?#]+(:\d+)?(/\S*)?$", re.IGNORECASE)
+
+_STYLE_INITIALIZED = False
+
+
+def _init_styles(root: tk.Misc) -> None:
+    """Apply the dark settings-dialog styles to the active theme, once per process."""
+    global _STYLE_INITIALIZED
+    if _STYLE_INITIALIZED:
+        return
+    
+    bg_color = "#121212"  # Dark background
+    text_color = "#FFFFFF"  # White text
+    border_color = "#333333"  # Dark gray for borders
+    
+    field = {"fieldbackground": bg_color, "foreground": text_color, "bordercolor": border_color}
+    bordered = {"background": bg_color, "foreground": text_color, "borderwidth": 1, "bordercolor": border_color}
+    settings = {
+        "TFrame": {"configure": {"background": bg_color, "borderwidth": 0}},
+        "TLabelframe": {"configure": {"background": bg_color, "borderwidth": 1, "relief": "solid", "bordercolor": border_color}},
+        "TLabelframe.Label": {"configure": {"background": bg_color, "foreground": text_color}},
+        "TLabel": {"configure": {"background": bg_color, "foreground": text_color, "borderwidth": 0}},
+        "TButton": {"configure": bordered},
+        "TEntry": {"configure": field},
+        "TNotebook": {"configure": {"background": bg_color, "borderwidth": 0}},
+        "TNotebook.Tab": {"configure": bordered},
+        "TCheckbutton": {"configure": {"background": bg_color, "foreground": text_color}},
+        "TSpinbox": {"configure": field},
+    }
+    # theme_settings sends everything to Tk as a single script
+    style = ttk.Style(root)
+    style.theme_settings(style.theme_use(), settings)
+    _STYLE_INITIALIZED = True
 
 
 class ConfigDialog:
     """Dialog for editing the application configuration."""
     
-    def __init__(self, parent, config):
+    def __init__(self, parent, config, withdraw=False):
         self.parent = parent
-        self.config = config.copy()
+        # Only read from; save() builds a fresh dict for the result
+        self._parent_config = config
         self.result = None
         
-        # Create dialog window
+        # Create dialog window, hidden until show() is called
         self.dialog = tk.Toplevel(parent)
+        self.dialog.withdraw()
         self.dialog.title("Spotube Settings")
         self.dialog.geometry("500x550")
         self.dialog.transient(parent)
-        self.dialog.grab_set()
+        self._closed = tk.BooleanVar(self.dialog, value=False)
         
         # Define colors for consistency
         self.bg_color = "#121212"  # Dark background
@@ -875,31 +1526,41 @@ class ConfigDialog:
         self.accent_color = "#1DB954"  # Spotify green
         self.border_color = "#333333"  # Dark gray for borders
         
-        # Configure ttk styles to remove/darken borders
-        self.configure_styles()
-        
-        # Make dialog modal
-        self.dialog.focus_set()
         self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
         
         # Create UI
         self.create_ui()
         
-        # Wait for dialog to close
-        parent.wait_window(self.dialog)
-    
-    def configure_styles(self):
-        style = ttk.Style()
-        style.configure("TFrame", background=self.bg_color, borderwidth=0)
-        style.configure("TLabelframe", background=self.bg_color, borderwidth=1, relief="solid", bordercolor=self.border_color)
-        style.configure("TLabelframe.Label", background=self.bg_color, foreground=self.text_color)
-        style.configure("TLabel", background=self.bg_color, foreground=self.text_color, borderwidth=0)
-        style.configure("TButton", background=self.bg_color, foreground=self.text_color, borderwidth=1, bordercolor=self.border_color)
-        style.configure("TEntry", fieldbackground=self.bg_color, foreground=self.text_color, bordercolor=self.border_color)
-        style.configure("TNotebook", background=self.bg_color, borderwidth=0)
-        style.configure("TNotebook.Tab", background=self.bg_color, foreground=self.text_color, borderwidth=1, bordercolor=self.border_color)
-        style.configure("TCheckbutton", background=self.bg_color, foreground=self.text_color)
-        style.configure("TSpinbox", fieldbackground=self.bg_color, foreground=self.text_color, bordercolor=self.border_color)
+        if not withdraw:
+            self.show()
+    
+    def show(self):
+        """Show the dialog modally and wait until it is saved or cancelled."""
+        self.result = None
+        self.dialog.deiconify()
+        self.dialog.grab_set()
+        self.dialog.focus_set()
+        self.parent.wait_variable(self._closed)
+        return self.result
+    
+    def reload(self, config):
+        """Refresh the fields from the current config before showing the dialog again."""
+        self._parent_config = config
+        
+        if "Spotify" in self._built:
+            self._v_client_id.set(self._parent_config["spotify"]["client_id"])
+            self._v_client_secret.set(self._parent_config["spotify"]["client_secret"])
+            self._v_redirect_uri.set(self._parent_config["spotify"]["redirect_uri"])
+        
+        if "YouTube" in self._built:
+            self._v_api_key.set(self._parent_config["youtube"]["api_key"])
+        
+        if "App Settings" in self._built:
+            self._v_check_interval.set(str(self._parent_config["app"]["check_interval"]))
+            self.mute_spotify_var.set(self._parent_config["app"]["mute_spotify"])
+            self.mpv_fullscreen_var.set(self._parent_config["app"]["mpv_fullscreen"])
+            self._v_window_width.set(str(self._parent_config["app"]["mpv_window_width"]))
+            self._v_window_height.set(str(self._parent_config["app"]["mpv_window_height"]))
     
     def create_ui(self):
         """Create the configuration dialog UI."""
@@ -907,32 +1568,57 @@ class ConfigDialog:
         main_frame = ttk.Frame(self.dialog, padding=10)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Notebook for tabs
-        notebook = ttk.Notebook(main_frame)
-        notebook.pack(fill=tk.BOTH, expand=True, pady=10)
+        # Notebook for tabs. Tab contents are only built the first time
+        # the tab is shown, so opening the dialog stays cheap.
+        self.notebook = ttk.Notebook(main_frame)
+        self.notebook.pack(fill=tk.BOTH, expand=True, pady=10)
+        
+        self._tab_builders = {}
+        self._built = set()
+        for text, builder in (
+            ("Spotify", self._build_spotify_tab),
+            ("YouTube", self._build_youtube_tab),
+            ("App Settings", self._build_app_tab),
+        ):
+            frame = ttk.Frame(self.notebook, padding=10)
+            self.notebook.add(frame, text=text)
+            self._tab_builders[str(frame)] = (text, builder, frame)
+        
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab)
+        self._on_tab()
         
-        # =====================
-        # Spotify tab
-        # =====================
-        spotify_frame = ttk.Frame(notebook, padding=10)
-        notebook.add(spotify_frame, text="Spotify")
+        # Buttons
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=10)
         
+        ttk.Button(button_frame, text="Save", command=self.save).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self.cancel).pack(side=tk.RIGHT, padx=5)
+    
+    def _on_tab(self, event=None):
+        """Build the selected tab's widgets the first time it is shown."""
+        text, builder, frame = self._tab_builders[self.notebook.select()]
+        if text not in self._built:
+            self._built.add(text)
+            builder(frame)
+    
+    def _build_spotify_tab(self, spotify_frame):
+        """Build the Spotify credentials tab."""
         # Create a frame for the credentials
         creds_frame = ttk.LabelFrame(spotify_frame, text="Spotify API Credentials")
-        creds_frame.grid(row=0, column=0, columnspan=2, sticky=tk.W+tk.E+tk.N, pady=5, padx=5)
+        creds_frame.grid(row=0, column=0, columnspan=2, sticky=NEW, pady=5, padx=5)
         creds_frame.columnconfigure(1, weight=1)  # Make the entry column expandable
         
         # Client ID
         ttk.Label(creds_frame, text="Client ID:").grid(row=0, column=0, sticky=tk.W, pady=5, padx=5)
-        self.spotify_client_id = ttk.Entry(creds_frame, width=40)
-        self.spotify_client_id.grid(row=0, column=1, sticky=tk.W+tk.E, pady=5, padx=5)
-        self.spotify_client_id.insert(0, self.config["spotify"]["client_id"])
+        self._v_client_id = tk.StringVar(self.dialog, value=self._parent_config["spotify"]["client_id"])
+        self.spotify_client_id = ttk.Entry(creds_frame, width=40, textvariable=self._v_client_id)
+        self.spotify_client_id.grid(row=0, column=1, sticky=EW, pady=5, padx=5)
         
         # Client Secret
         ttk.Label(creds_frame, text="Client Secret:").grid(row=1, column=0, sticky=tk.W, pady=5, padx=5)
-        self.spotify_client_secret = ttk.Entry(creds_frame, width=40, show="*")
-        self.spotify_client_secret.grid(row=1, column=1, sticky=tk.W+tk.E, pady=5, padx=5)
-        self.spotify_client_secret.insert(0, self.config["spotify"]["client_secret"])
+        self._v_client_secret = tk.StringVar(self.dialog, value=self._parent_config["spotify"]["client_secret"])
+        self.spotify_client_secret = ttk.Entry(creds_frame, width=40, show="*", textvariable=self._v_client_secret)
+        self.spotify_client_secret.grid(row=1, column=1, sticky=EW, pady=5, padx=5)
         
         # Toggle button to show/hide secret
         self.show_secret_var = tk.BooleanVar(value=False)
@@ -946,47 +1632,25 @@ class ConfigDialog:
         
         # Redirect URI
         ttk.Label(creds_frame, text="Redirect URI:").grid(row=2, column=0, sticky=tk.W, pady=5, padx=5)
-        self.spotify_redirect_uri = ttk.Entry(creds_frame, width=40)
-        self.spotify_redirect_uri.grid(row=2, column=1, sticky=tk.W+tk.E, pady=5, padx=5)
-        self.spotify_redirect_uri.insert(0, self.config["spotify"]["redirect_uri"])
+        self._v_redirect_uri = tk.StringVar(self.dialog, value=self._parent_config["spotify"]["redirect_uri"])
+        self.spotify_redirect_uri = ttk.Entry(creds_frame, width=40, textvariable=self._v_redirect_uri)
+        self.spotify_redirect_uri.grid(row=2, column=1, sticky=EW, pady=5, padx=5)
         
         # Default button
         default_uri_button = ttk.Button(
             creds_frame,
             text="Default",
-            command=lambda: self.spotify_redirect_uri.delete(0, tk.END) or 
-                        self.spotify_redirect_uri.insert(0, "http://localhost:8080")
+            command=self._reset_redirect_uri
         )
         default_uri_button.grid(row=2, column=2, padx=5)
         
         # Help text in a scrollable frame
         help_frame = ttk.LabelFrame(spotify_frame, text="Spotify Developer Setup Instructions")
-        help_frame.grid(row=1, column=0, columnspan=2, sticky=tk.W+tk.E+tk.N+tk.S, pady=10, padx=5)
+        help_frame.grid(row=1, column=0, columnspan=2, sticky=NSEW, pady=10, padx=5)
         help_frame.columnconfigure(0, weight=1)
         help_frame.rowconfigure(0, weight=1)
         
-        # Detailed instructions
-        help_text = (
-            "To connect Spotube with your Spotify account:\n\n"
-            "1. Go to https://developer.spotify.com/dashboard/ and log in\n"
-            "2. Click 'Create App' button\n"
-            "3. Fill in the following details:\n"
-            "   • App name: Spotube (or any name you prefer)\n"
-            "   • App description: Personal YouTube music video player\n"
-            "   • Website: You can leave this blank\n"
-            "   • Redirect URI: http://localhost:8080\n"
-            "4. Check the Developer Terms of Service and click 'Create'\n"
-            "5. On your app's dashboard, you'll see your Client ID\n"
-            "6. Click 'Show Client Secret' to reveal your Client Secret\n"
-            "7. Copy both values to the fields above\n\n"
-            "Important: Keep your Client Secret private. Never share it publicly.\n\n"
-            "When you first run Spotube, a browser window will open asking you to\n"
-            "authorize the app to access your Spotify account. This is normal and\n"
-            "required for Spotube to see what you're currently playing."
-        )
-        
         # Add scrollable text widget
-        from tkinter import scrolledtext
         help_text_widget = scrolledtext.ScrolledText(
         help_frame, 
         wrap=tk.WORD, 
@@ -1000,13 +1664,13 @@ class ConfigDialog:
         highlightcolor=self.border_color,
         highlightthickness=1
         )
-        help_text_widget.insert(tk.INSERT, help_text)
+        help_text_widget.insert(tk.INSERT, _SPOTIFY_HELP_TEXT)
         help_text_widget.config(state=tk.DISABLED)  # Make read-only
-        help_text_widget.grid(row=0, column=0, sticky=tk.W+tk.E+tk.N+tk.S, padx=5, pady=5)
+        help_text_widget.grid(row=0, column=0, sticky=NSEW, padx=5, pady=5)
         
         # Add a direct link button
         button_frame = ttk.Frame(help_frame)
-        button_frame.grid(row=1, column=0, sticky=tk.E+tk.W, pady=5)
+        button_frame.grid(row=1, column=0, sticky=EW, pady=5)
         
         link_button = ttk.Button(
             button_frame, 
@@ -1022,44 +1686,25 @@ class ConfigDialog:
             command=self.test_spotify_connection
         )
         test_button.pack(side=tk.RIGHT, padx=5)
-        
-        # =====================
-        # YouTube tab
-        # =====================
-        youtube_frame = ttk.Frame(notebook, padding=10)
-        notebook.add(youtube_frame, text="YouTube")
-        
+    
+    def _build_youtube_tab(self, youtube_frame):
+        """Build the YouTube API key tab."""
         # API Key field
         api_key_frame = ttk.LabelFrame(youtube_frame, text="YouTube API Key")
-        api_key_frame.grid(row=0, column=0, sticky=tk.W+tk.E, pady=5, padx=5)
+        api_key_frame.grid(row=0, column=0, sticky=EW, pady=5, padx=5)
         api_key_frame.columnconfigure(1, weight=1)
         
         ttk.Label(api_key_frame, text="API Key:").grid(row=0, column=0, sticky=tk.W, pady=5, padx=5)
-        self.youtube_api_key = ttk.Entry(api_key_frame, width=40)
-        self.youtube_api_key.grid(row=0, column=1, sticky=tk.W+tk.E, pady=5, padx=5)
-        self.youtube_api_key.insert(0, self.config["youtube"]["api_key"])
+        self._v_api_key = tk.StringVar(self.dialog, value=self._parent_config["youtube"]["api_key"])
+        self.youtube_api_key = ttk.Entry(api_key_frame, width=40, textvariable=self._v_api_key)
+        self.youtube_api_key.grid(row=0, column=1, sticky=EW, pady=5, padx=5)
         
         # Help text in a scrollable frame
         yt_help_frame = ttk.LabelFrame(youtube_frame, text="YouTube API Setup Instructions")
-        yt_help_frame.grid(row=1, column=0, sticky=tk.W+tk.E+tk.N+tk.S, pady=10, padx=5)
+        yt_help_frame.grid(row=1, column=0, sticky=NSEW, pady=10, padx=5)
         yt_help_frame.columnconfigure(0, weight=1)
         yt_help_frame.rowconfigure(0, weight=1)
         
-        # Detailed instructions
-        yt_help_text = (
-            "To get a YouTube Data API key:\n\n"
-            "1. Go to https://console.cloud.google.com/\n"
-            "2. Sign in with your Google account\n"
-            "3. Create a new project (click on project dropdown at top → New Project)\n"
-            "4. Once in your project, go to 'APIs & Services' → 'Library'\n"
-            "5. Search for 'YouTube Data API v3' and select it\n"
-            "6. Click 'Enable' to activate the API for your project\n"
-            "7. Go to 'APIs & Services' → 'Credentials'\n"
-            "8. Click 'Create Credentials' → 'API key'\n"
-            "9. Copy your new API key and paste it in the field above\n\n"
-            "Note: The free tier allows 10,000 queries per day, which is plenty for personal use."
-        )
-        
         # Add scrollable text widget
         yt_help_text_widget = scrolledtext.ScrolledText(
         yt_help_frame, 
@@ -1075,13 +1720,13 @@ class ConfigDialog:
         highlightthickness=1
         )
         
-        yt_help_text_widget.insert(tk.INSERT, yt_help_text)
+        yt_help_text_widget.insert(tk.INSERT, _YT_HELP_TEXT)
         yt_help_text_widget.config(state=tk.DISABLED)  # Make read-only
-        yt_help_text_widget.grid(row=0, column=0, sticky=tk.W+tk.E+tk.N+tk.S, padx=5, pady=5)
+        yt_help_text_widget.grid(row=0, column=0, sticky=NSEW, padx=5, pady=5)
         
         # Add a direct link button
         yt_button_frame = ttk.Frame(yt_help_frame)
-        yt_button_frame.grid(row=1, column=0, sticky=tk.E+tk.W, pady=5)
+        yt_button_frame.grid(row=1, column=0, sticky=EW, pady=5)
         
         yt_link_button = ttk.Button(
             yt_button_frame, 
@@ -1097,24 +1742,26 @@ class ConfigDialog:
             command=self.test_youtube_api_key
         )
         yt_test_button.pack(side=tk.RIGHT, padx=5)
-        
-        # =====================
-        # App Settings tab
-        # =====================
-        app_frame = ttk.Frame(notebook, padding=10)
-        notebook.add(app_frame, text="App Settings")
-        
+    
+    def _build_app_tab(self, app_frame):
+        """Build the app settings tab."""
         # Playback settings
         playback_frame = ttk.LabelFrame(app_frame, text="Playback Settings")
-        playback_frame.grid(row=0, column=0, sticky=tk.W+tk.E+tk.N, pady=5, padx=5)
+        playback_frame.grid(row=0, column=0, sticky=NEW, pady=5, padx=5)
         playback_frame.columnconfigure(1, weight=1)
         
+        # Reject non-numeric keystrokes in the spinboxes
+        int_check = (self.dialog.register(self._is_int), "%P")
+        
         ttk.Label(playback_frame, text="Check Interval (seconds):").grid(row=0, column=0, sticky=tk.W, pady=5, padx=5)
-        self.check_interval = ttk.Spinbox(playback_frame, from_=1, to=30, width=5)
+        self._v_check_interval = tk.StringVar(self.dialog, value=str(self._parent_config["app"]["check_interval"]))
+        self.check_interval = ttk.Spinbox(
+            playback_frame, from_=1, to=30, width=5, textvariable=self._v_check_interval,
+            validate="key", validatecommand=int_check
+        )
         self.check_interval.grid(row=0, column=1, sticky=tk.W, pady=5, padx=5)
-        self.check_interval.insert(0, str(self.config["app"]["check_interval"]))
         
-        self.mute_spotify_var = tk.BooleanVar(value=self.config["app"]["mute_spotify"])
+        self.mute_spotify_var = tk.BooleanVar(value=self._parent_config["app"]["mute_spotify"])
         mute_spotify_check = ttk.Checkbutton(
             playback_frame, 
             text="Mute Spotify while playing videos",
@@ -1124,10 +1771,10 @@ class ConfigDialog:
         
         # Video window settings
         window_frame = ttk.LabelFrame(app_frame, text="Video Window Settings")
-        window_frame.grid(row=1, column=0, sticky=tk.W+tk.E+tk.N, pady=5, padx=5)
+        window_frame.grid(row=1, column=0, sticky=NEW, pady=5, padx=5)
         window_frame.columnconfigure(1, weight=1)
         
-        self.mpv_fullscreen_var = tk.BooleanVar(value=self.config["app"]["mpv_fullscreen"])
+        self.mpv_fullscreen_var = tk.BooleanVar(value=self._parent_config["app"]["mpv_fullscreen"])
         mpv_fullscreen_check = ttk.Checkbutton(
             window_frame, 
             text="Play videos in fullscreen",
@@ -1136,38 +1783,32 @@ class ConfigDialog:
         mpv_fullscreen_check.grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=5, padx=5)
         
         ttk.Label(window_frame, text="Video Window Width:").grid(row=1, column=0, sticky=tk.W, pady=5, padx=5)
-        self.mpv_window_width = ttk.Spinbox(window_frame, from_=320, to=3840, width=5)
+        self._v_window_width = tk.StringVar(self.dialog, value=str(self._parent_config["app"]["mpv_window_width"]))
+        self.mpv_window_width = ttk.Spinbox(
+            window_frame, from_=320, to=3840, width=5, textvariable=self._v_window_width,
+            validate="key", validatecommand=int_check
+        )
         self.mpv_window_width.grid(row=1, column=1, sticky=tk.W, pady=5, padx=5)
-        self.mpv_window_width.insert(0, str(self.config["app"]["mpv_window_width"]))
         
         ttk.Label(window_frame, text="Video Window Height:").grid(row=2, column=0, sticky=tk.W, pady=5, padx=5)
-        self.mpv_window_height = ttk.Spinbox(window_frame, from_=240, to=2160, width=5)
+        self._v_window_height = tk.StringVar(self.dialog, value=str(self._parent_config["app"]["mpv_window_height"]))
+        self.mpv_window_height = ttk.Spinbox(
+            window_frame, from_=240, to=2160, width=5, textvariable=self._v_window_height,
+            validate="key", validatecommand=int_check
+        )
         self.mpv_window_height.grid(row=2, column=1, sticky=tk.W, pady=5, padx=5)
-        self.mpv_window_height.insert(0, str(self.config["app"]["mpv_window_height"]))
         
         # About section
         about_frame = ttk.LabelFrame(app_frame, text="About Spotube")
-        about_frame.grid(row=2, column=0, sticky=tk.W+tk.E+tk.N+tk.S, pady=5, padx=5)
-        
-        about_text = (
-            "Spotube plays YouTube music videos that match your currently playing Spotify tracks.\n\n"
-            "Requirements:\n"
-            "• MPV Player (https://mpv.io/)\n"
-            "• Spotify Premium account\n"
-            "• YouTube Data API key\n\n"
-            "Version: 1.0.0"
-        )
+        about_frame.grid(row=2, column=0, sticky=NSEW, pady=5, padx=5)
         
-        about_label = ttk.Label(about_frame, text=about_text, wraplength=400, justify=tk.LEFT)
+        about_label = ttk.Label(about_frame, text=_ABOUT_TEXT, wraplength=400, justify=tk.LEFT)
         about_label.pack(padx=5, pady=5, anchor=tk.W)
-        
-        # Buttons
-        button_frame = ttk.Frame(main_frame)
-        button_frame.pack(fill=tk.X, pady=10)
-        
-        ttk.Button(button_frame, text="Save", command=self.save).pack(side=tk.RIGHT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=self.cancel).pack(side=tk.RIGHT, padx=5)
-        
+    
+    def _reset_redirect_uri(self):
+        """Put the default redirect URI back in the form."""
+        self._v_redirect_uri.set("http://localhost:8080")
+    
     def toggle_secret_visibility(self):
         """Toggle visibility of the client secret."""
         if self.show_secret_var.get():
@@ -1177,57 +1818,51 @@ class ConfigDialog:
 
     def test_spotify_connection(self):
         """Test the Spotify API connection with current credentials."""
-        # Save current values to config temporarily
-        temp_client_id = self.config["spotify"]["client_id"]
-        temp_client_secret = self.config["spotify"]["client_secret"]
-        temp_redirect_uri = self.config["spotify"]["redirect_uri"]
+        # The client credentials flow below never touches the redirect URI,
+        # so at least make sure it looks like a URL
+        if not _REDIRECT_URI_RE.match(self._v_redirect_uri.get().strip()):
+            messagebox.showerror(
+                "Invalid Redirect URI",
+                "The redirect URI must be a full URL, e.g. http://localhost:8080"
+            )
+            return
         
+        auth = sp = None
         try:
-            # Update config with current values
-            self.config["spotify"]["client_id"] = self.spotify_client_id.get()
-            self.config["spotify"]["client_secret"] = self.spotify_client_secret.get()
-            self.config["spotify"]["redirect_uri"] = self.spotify_redirect_uri.get()
-            
-            # Create a temporary Spotify client
-            sp = spotipy.Spotify(
-                auth_manager=SpotifyOAuth(
-                    client_id=self.config["spotify"]["client_id"],
-                    client_secret=self.config["spotify"]["client_secret"],
-                    redirect_uri=self.config["spotify"]["redirect_uri"],
-                    scope="user-read-playback-state",
-                    open_browser=True
-                )
+            # Create a temporary app-only Spotify client from the values in the form;
+            # this checks the credentials without a browser login or touching the token cache
+            auth = SpotifyClientCredentials(
+                client_id=self._v_client_id.get(),
+                client_secret=self._v_client_secret.get()
             )
+            sp = spotipy.Spotify(auth_manager=auth)
             
-            # Try to get current user info
-            user_info = sp.current_user()
+            # Any endpoint that doesn't need a user scope will do
+            sp.search(q="a", limit=1, type="track")
             
             # If we get here, connection was successful
             messagebox.showinfo(
                 "Connection Successful", 
-                f"Successfully connected to Spotify as {user_info['display_name']}!"
+                "Successfully connected to Spotify with these credentials!"
             )
         except Exception as e:
             messagebox.showerror("Connection Failed", f"Failed to connect to Spotify: {e}")
         finally:
-            # Restore original config values
-            self.config["spotify"]["client_id"] = temp_client_id
-            self.config["spotify"]["client_secret"] = temp_client_secret
-            self.config["spotify"]["redirect_uri"] = temp_redirect_uri
+            # Don't leave the throwaway client's connections open until GC gets to them
+            for client in (sp, auth):
+                try:
+                    client._session.close()
+                except Exception:
+                    pass
 
     def test_youtube_api_key(self):
         """Test the YouTube API key."""
-        # Save current value to config temporarily
-        temp_api_key = self.config["youtube"]["api_key"]
-        
+        youtube = None
         try:
-            # Update config with current value
-            self.config["youtube"]["api_key"] = self.youtube_api_key.get()
-            
-            # Create a YouTube API client
-            youtube = build(
-                "youtube", "v3", developerKey=self.config["youtube"]["api_key"]
-            )
+            # Use a throwaway client for the key in the form. It has its own HTTP
+            # connection, so it doesn't wait on (or get cached next to) the
+            # client that background searches share
+            youtube = _build_youtube_client(self._v_api_key.get())
             
             # Try to search for a video
             request = youtube.search().list(
@@ -1250,44 +1885,140 @@ class ConfigDialog:
         except Exception as e:
             messagebox.showerror("API Key Invalid", f"Failed to connect to YouTube API: {e}")
         finally:
-            # Restore original config value
-            self.config["youtube"]["api_key"] = temp_api_key
+            if youtube is not None:
+                youtube.close()
 
     def save(self):
         """Save the configuration and close the dialog."""
-        try:
-            # Update Spotify config
-            self.config["spotify"]["client_id"] = self.spotify_client_id.get()
-            self.config["spotify"]["client_secret"] = self.spotify_client_secret.get()
-            self.config["spotify"]["redirect_uri"] = self.spotify_redirect_uri.get()
-            
-            # Update YouTube config
-            self.config["youtube"]["api_key"] = self.youtube_api_key.get()
-            
-            # Update app config
-            self.config["app"]["check_interval"] = int(self.check_interval.get())
-            self.config["app"]["mute_spotify"] = self.mute_spotify_var.get()
-            self.config["app"]["mpv_fullscreen"] = self.mpv_fullscreen_var.get()
-            self.config["app"]["mpv_window_width"] = int(self.mpv_window_width.get())
-            self.config["app"]["mpv_window_height"] = int(self.mpv_window_height.get())
-            
-            self.result = self.config
-            self.dialog.destroy()
-        except ValueError as e:
-            messagebox.showerror("Invalid Input", f"Please check your inputs: {e}")
+        # Start from a copy of the current config; tabs that were never
+        # opened keep their current values
+        config = {section: dict(values) for section, values in self._parent_config.items()}
+        
+        # Update Spotify config
+        if "Spotify" in self._built:
+            config["spotify"]["client_id"] = self._v_client_id.get()
+            config["spotify"]["client_secret"] = self._v_client_secret.get()
+            config["spotify"]["redirect_uri"] = self._v_redirect_uri.get()
+        
+        # Update YouTube config
+        if "YouTube" in self._built:
+            config["youtube"]["api_key"] = self._v_api_key.get()
+        
+        # Update app config
+        if "App Settings" in self._built:
+            app = config["app"]
+            app["check_interval"] = self._spinbox_value(self.check_interval, app["check_interval"])
+            app["mute_spotify"] = self.mute_spotify_var.get()
+            app["mpv_fullscreen"] = self.mpv_fullscreen_var.get()
+            app["mpv_window_width"] = self._spinbox_value(self.mpv_window_width, app["mpv_window_width"])
+            app["mpv_window_height"] = self._spinbox_value(self.mpv_window_height, app["mpv_window_height"])
+        
+        self.result = config
+        self._close()
+    
+    @staticmethod
+    def _spinbox_value(spinbox, default):
+        """Read a numeric spinbox, clamped to its from/to range.
+        
+        Typed values aren't range checked (validation has to allow partial
+        input), and an empty field keeps the current setting.
+        """
+        value = int(spinbox.get() or default)
+        low, high = int(float(spinbox.cget("from"))), int(float(spinbox.cget("to")))
+        return min(max(value, low), high)
+    
+    @staticmethod
+    def _is_int(value):
+        """Spinbox validatecommand: allow only digits (or an empty field while typing)."""
+        return value == "" or (value.isdigit() and int(value) < 10**6)
     
     def cancel(self):
         """Cancel and close the dialog."""
-        self.dialog.destroy()
+        self._close()
+    
+    def _close(self):
+        """Hide the dialog so it can be reused, and end the wait in show()."""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+        self._closed.set(True)
 
-def load_image_from_url(url):
-    """Load an image from a URL and return a PIL Image object."""
+def _image_cache_path(url):
+    """Return the disk cache file for an image URL."""
+    return IMAGE_CACHE_DIR / hashlib.sha1(url.encode()).hexdigest()
+
+def _prune_image_cache():
+    """Delete the least recently used cached images beyond the size limit."""
     try:
-        with urllib.request.urlopen(url) as response:
-            image_data = response.read()
-        return Image.open(io.BytesIO(image_data))
+        files = [entry for entry in os.scandir(IMAGE_CACHE_DIR) if entry.is_file()]
+        if len(files) <= IMAGE_DISK_CACHE_MAX_FILES:
+            return
+        files.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in files[:len(files) - IMAGE_DISK_CACHE_MAX_FILES]:
+            os.remove(entry.path)
+    except OSError as e:
+        print(f"Failed to prune image cache: {e}")
+
+def _open_cached_image(url):
+    """Open an image from the disk cache, streaming it to disk on a miss."""
+    path = _image_cache_path(url)
+    if path.exists():
+        try:
+            os.utime(path)  # Mark as recently used for pruning
+        except OSError:
+            pass
+        return Image.open(path)
+    
+    try:
+        IMAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_available = True
+    except OSError as e:
+        print(f"Image cache unavailable: {e}")
+        cache_available = False
+    
+    with _HTTP.get(url, stream=True, timeout=5) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        
+        if not cache_available:
+            img = Image.open(response.raw)
+            img.load()  # Decode before the connection is released
+            return img
+        
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                shutil.copyfileobj(response.raw, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            # Don't leave a partial download behind for the pruner to count
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise
+    _prune_image_cache()
+    return Image.open(path)
+
+def load_image_from_url(url, size=(300, 300), resample=Image.BILINEAR):
+    """Load an image from a URL (via the disk cache) and return a PIL Image scaled to fit within size."""
+    width, height = size
+    try:
+        for attempt in range(2):
+            try:
+                img = _open_cached_image(url)
+                # Let libjpeg decode at a reduced scale; no-op for other formats
+                img.draft("RGB", (width * 2, height * 2))
+                img.thumbnail(size, resample)
+                return img
+            except OSError:
+                # A corrupt or truncated cache file would fail the same way every
+                # time, so drop it and download the image again once
+                path = _image_cache_path(url)
+                if attempt or not path.exists():
+                    raise
+                path.unlink()
     except Exception as e:
-        print(f"Error loading image from URL: {e}")
+        print(f"Failed to load image: {e}")
         return None
 
 def main():
@@ -1298,17 +2029,22 @@ def main():
     # Create app instance first
     app = SpotubeGUI(root)
     
-
-    # Set icon if available
-    try:
-        icon_path = Path(__file__).parent / "icon.png"
-        if icon_path.exists():
-            img = Image.open(icon_path)
-            photo = ImageTk.PhotoImage(img)
-            root.iconphoto(True, photo)
-    except Exception:
-        pass
-        
+    def _set_icon():
+        """Set the window icon once the main window has had a chance to draw."""
+        try:
+            icon_path = Path(__file__).parent / "icon.png"
+            if icon_path.exists():
+                img = Image.open(icon_path)
+                photo = ImageTk.PhotoImage(img)
+                root.iconphoto(True, photo)
+        except Exception:
+            pass
+    
+    # Set icon if available, without holding up the first paint. If the config
+    # couldn't be loaded the app has already destroyed the window
+    if app.config:
+        root.after_idle(_set_icon)
+    
     root.mainloop()
 
 if __name__ == "__main__":